@@ -1,9 +1,13 @@
 """
 Authentication module for OAuth (Google & GitHub) and JWT token management.
 """
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
+import hashlib
 import os
+import time
+
 import httpx
 from jose import JWTError, jwt
 from fastapi import HTTPException, status, Depends
@@ -50,8 +54,47 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security))
         )
 
 
+# Verified Google ID-token claims keyed on the token hash. The SPA
+# re-sends the same ID token on every load, so after the first
+# verification the Google round trip is skipped for the token's
+# remaining lifetime (capped, and never past the token's own exp).
+_GOOGLE_TOKEN_CACHE_MAX_ENTRIES = 512
+_GOOGLE_TOKEN_CACHE_TTL = 300
+_google_token_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+
+
+def _cached_google_claims(key: bytes) -> Optional[Dict[str, Any]]:
+    entry = _google_token_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, user_info = entry
+    if expires_at < time.monotonic():
+        del _google_token_cache[key]
+        return None
+    _google_token_cache.move_to_end(key)
+    return user_info
+
+
+def _cache_google_claims(key: bytes, token_exp: Any, user_info: Dict[str, Any]) -> None:
+    try:
+        remaining = int(token_exp) - int(time.time())
+    except (TypeError, ValueError):
+        remaining = 0
+    ttl = min(_GOOGLE_TOKEN_CACHE_TTL, remaining)
+    if ttl <= 0:
+        return
+    _google_token_cache[key] = (time.monotonic() + ttl, user_info)
+    while len(_google_token_cache) > _GOOGLE_TOKEN_CACHE_MAX_ENTRIES:
+        _google_token_cache.popitem(last=False)
+
+
 async def verify_google_token(token: str) -> Optional[Dict[str, Any]]:
     """Verify Google OAuth token and return user info if valid."""
+    cache_key = hashlib.sha256(token.encode()).digest()
+    cached = _cached_google_claims(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         async with httpx.AsyncClient() as client:
             response = await client.get(
@@ -64,13 +107,15 @@ async def verify_google_token(token: str) -> Optional[Dict[str, Any]]:
                 if GOOGLE_CLIENT_ID and data.get("aud") != GOOGLE_CLIENT_ID:
                     return None
 
-                return {
+                user_info = {
                     "id": data.get("sub"),
                     "email": data.get("email"),
                     "name": data.get("name"),
                     "avatar": data.get("picture"),
                     "provider": "google"
                 }
+                _cache_google_claims(cache_key, data.get("exp"), user_info)
+                return user_info
             return None
     except Exception as e:
         print(f"Error verifying Google token: {e}")
@@ -1,12 +1,30 @@
-from datetime import datetime
+import asyncio
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+from decimal import Decimal
 from typing import Any, Dict, List
 
+import hashlib
+import io
+import json
 import os
+import threading
 
+import orjson
 import psycopg2
-import psycopg2.extras
-from fastapi import FastAPI, HTTPException, Depends
+import psycopg2.pool
+
+try:
+    import redis
+except ImportError:  # Cache is optional; fall back to hitting the DB
+    redis = None
+from fastapi import FastAPI, HTTPException, Depends, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 import time
 
@@ -25,74 +43,593 @@ DB_USER = os.getenv("DB_USER", "postgres")
 DB_PASSWORD = os.getenv("DB_PASSWORD", "m2wurbpn")
 
 
-def get_conn():
+# Connection pool sizing - reused across requests to avoid per-call
+# TCP/TLS/auth handshakes against RDS
+POOL_MIN_CONN = int(os.getenv("DB_POOL_MIN", "5"))
+POOL_MAX_CONN = int(os.getenv("DB_POOL_MAX", "20"))
+
+PG_POOL = None
+
+# getconn() raises PoolError the moment all connections are checked
+# out - there is no queueing - and the dashboard fan-out can hold 7-8
+# connections per request. This gate makes excess callers wait for a
+# free slot instead of hard-failing, with a timeout so a stuck query
+# can't wedge the whole worker.
+POOL_WAIT_TIMEOUT = float(os.getenv("DB_POOL_WAIT_TIMEOUT", "30"))
+POOL_GATE = threading.BoundedSemaphore(POOL_MAX_CONN)
+
+# Optional Redis result cache. Analytics results only change when the
+# materialized views are refreshed, so a short TTL absorbs repeated
+# dashboard hits without serving stale data for long.
+REDIS_URL = os.getenv("REDIS_URL", "")
+QUERY_CACHE_TTL = int(os.getenv("QUERY_CACHE_TTL", "60"))
+
+REDIS_CLIENT = None
+if redis is not None and REDIS_URL:
     try:
-        return psycopg2.connect(
-            host=DB_HOST,
-            port=DB_PORT,
-            dbname=DB_NAME,
-            user=DB_USER,
-            password=DB_PASSWORD,
+        REDIS_CLIENT = redis.Redis.from_url(REDIS_URL)
+        REDIS_CLIENT.ping()
+    except Exception:
+        REDIS_CLIENT = None
+
+# In-process fallback cache used when Redis is not configured: a small
+# LRU of (expiry, rows) entries guarded by a lock. Per-worker rather
+# than shared, but still absorbs repeated dashboard hits.
+LOCAL_CACHE_MAX_ENTRIES = int(os.getenv("QUERY_CACHE_MAX_ENTRIES", "256"))
+LOCAL_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+LOCAL_CACHE_LOCK = threading.Lock()
+
+# Bumped on explicit cache invalidation so client-side ETags roll over
+# together with the server-side caches
+CACHE_GENERATION = 0
+
+
+def _json_default(value: Any) -> Any:
+    """JSON encoder for the row types psycopg2 hands back."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Unserializable type: {type(value)}")
+
+
+def _normalize_params(params: tuple) -> tuple:
+    """Canonicalize datetime parameters before caching and binding.
+
+    The UI only ever sends minute-or-coarser ranges, so stray
+    microseconds just fragment the result cache and Postgres'
+    prepared-statement plan cache across otherwise identical calls.
+    Timezone-aware values (the frontend sends ...Z suffixes) are
+    converted to naive UTC: the tables store plain timestamps, and a
+    naive and an aware datetime for the same instant must repr to the
+    same cache key or warmed entries never match live requests.
+    """
+    normalized = []
+    for p in params:
+        if isinstance(p, datetime):
+            if p.tzinfo is not None:
+                p = p.astimezone(timezone.utc).replace(tzinfo=None)
+            p = p.replace(microsecond=0)
+        normalized.append(p)
+    return tuple(normalized)
+
+
+def _cache_key(sql: str, params: tuple) -> str:
+    digest = hashlib.sha1(f"{sql}|{params!r}".encode()).hexdigest()
+    return f"query_cache:{digest}"
+
+
+def _cache_get(sql: str, params: tuple):
+    key = _cache_key(sql, params)
+    if REDIS_CLIENT is None:
+        with LOCAL_CACHE_LOCK:
+            entry = LOCAL_CACHE.get(key)
+            if entry is None:
+                return None
+            expires_at, rows = entry
+            if expires_at < time.monotonic():
+                del LOCAL_CACHE[key]
+                return None
+            LOCAL_CACHE.move_to_end(key)
+            return rows
+    try:
+        cached = REDIS_CLIENT.get(key)
+    except Exception:
+        return None
+    return json.loads(cached) if cached is not None else None
+
+
+def _cache_set(sql: str, params: tuple, rows: List[Dict[str, Any]]) -> None:
+    key = _cache_key(sql, params)
+    if REDIS_CLIENT is None:
+        with LOCAL_CACHE_LOCK:
+            LOCAL_CACHE[key] = (time.monotonic() + QUERY_CACHE_TTL, rows)
+            LOCAL_CACHE.move_to_end(key)
+            while len(LOCAL_CACHE) > LOCAL_CACHE_MAX_ENTRIES:
+                LOCAL_CACHE.popitem(last=False)
+        return
+    try:
+        REDIS_CLIENT.setex(
+            key,
+            QUERY_CACHE_TTL,
+            json.dumps(rows, default=_json_default),
+        )
+    except Exception:
+        pass
+
+
+def _get_pool() -> psycopg2.pool.ThreadedConnectionPool:
+    """Return the process-wide connection pool, creating it on first use."""
+    global PG_POOL
+    if PG_POOL is None:
+        try:
+            PG_POOL = psycopg2.pool.ThreadedConnectionPool(
+                POOL_MIN_CONN,
+                POOL_MAX_CONN,
+                host=DB_HOST,
+                port=DB_PORT,
+                dbname=DB_NAME,
+                user=DB_USER,
+                password=DB_PASSWORD,
+            )
+        except psycopg2.Error as e:
+            raise HTTPException(status_code=500, detail=f"DB connection failed: {e}")
+    return PG_POOL
+
+
+def get_conn():
+    if not POOL_GATE.acquire(timeout=POOL_WAIT_TIMEOUT):
+        raise HTTPException(
+            status_code=503,
+            detail="Timed out waiting for a database connection",
         )
+    try:
+        return _get_pool().getconn()
     except psycopg2.Error as e:
+        POOL_GATE.release()
         raise HTTPException(status_code=500, detail=f"DB connection failed: {e}")
+    except Exception:
+        POOL_GATE.release()
+        raise
 
 
-def run_query(sql: str, params: tuple) -> List[Dict[str, Any]]:
-    """Execute SQL query and return results as list of dictionaries."""
-    conn = get_conn()
+def put_conn(conn) -> None:
+    """Return a connection to the pool instead of closing it."""
     try:
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-            cur.execute(sql, params)
-            rows = cur.fetchall()
-        return [dict(r) for r in rows]
-    except psycopg2.Error as e:
-        raise HTTPException(status_code=500, detail=f"Query failed: {e}")
+        if PG_POOL is not None:
+            PG_POOL.putconn(conn)
+        else:
+            conn.close()
     finally:
-        conn.close()
+        POOL_GATE.release()
+
+
+# Server-side prepared statements skip the parse/plan step on repeat
+# executions of the same query over a pooled connection. Disable when
+# connecting through PgBouncer in transaction mode, where session state
+# does not survive between transactions.
+USE_PREPARED = os.getenv("DB_USE_PREPARED", "1") == "1"
+
+
+def _dollarize(sql: str) -> str:
+    """Rewrite %s placeholders as $1..$n for PREPARE."""
+    parts = sql.split("%s")
+    out = []
+    for i, part in enumerate(parts[:-1]):
+        out.append(part)
+        out.append(f"${i + 1}")
+    out.append(parts[-1])
+    return "".join(out)
+
+
+def _execute(conn, cur, sql: str, params: tuple) -> None:
+    """Execute via a per-connection prepared statement when possible."""
+    if not USE_PREPARED or not params:
+        cur.execute(sql, params)
+        return
+
+    name = "ps_" + hashlib.sha1(sql.encode()).hexdigest()[:16]
+    prepared = getattr(conn, "_prepared_statements", None)
+    if prepared is None:
+        prepared = set()
+        conn._prepared_statements = prepared
+    if name not in prepared:
+        cur.execute(f"PREPARE {name} AS {_dollarize(sql)}")
+        prepared.add(name)
+    placeholders = ", ".join(["%s"] * len(params))
+    cur.execute(f"EXECUTE {name} ({placeholders})", params)
+
+
+def _forget_prepared(conn) -> None:
+    """Resync after a rollback, which undoes any PREPAREs from that txn."""
+    try:
+        with conn.cursor() as cur:
+            cur.execute("DEALLOCATE ALL")
+        conn.commit()
+    except psycopg2.Error:
+        pass
+    conn._prepared_statements = set()
+
 
+@contextmanager
+def pooled_conn():
+    """Borrow a pooled connection for one unit of work.
 
-def run_query_timed(sql: str, params: tuple) -> tuple[List[Dict[str, Any]], float]:
-    """Run query and return results with execution time in ms."""
+    Commits on success, rolls back on driver errors (surfacing them as
+    HTTP 500), and always returns the connection to the pool, so no code
+    path can leak one.
+    """
     conn = get_conn()
     try:
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-            start = time.time()
-            cur.execute(sql, params)
-            rows = cur.fetchall()
-            elapsed_ms = (time.time() - start) * 1000
-        return [dict(r) for r in rows], elapsed_ms
+        yield conn
+        conn.commit()
     except psycopg2.Error as e:
+        conn.rollback()
+        _forget_prepared(conn)
         raise HTTPException(status_code=500, detail=f"Query failed: {e}")
     finally:
-        conn.close()
+        put_conn(conn)
 
 
-app = FastAPI(title="Funding-Aware Market Maker API")
+def _materialize(cur, fetched) -> List[Dict[str, Any]]:
+    """Build row dicts once from a tuple cursor's fetched rows.
+
+    RealDictCursor would allocate a dict subclass per row before the
+    response is even built; this is the single place rows take shape,
+    so serializer changes touch every query path at once.
+    """
+    cols = [d.name for d in cur.description]
+    return [dict(zip(cols, r)) for r in fetched]
+
+
+def _run_query_sync(sql: str, params: tuple) -> List[Dict[str, Any]]:
+    """Execute SQL query and return results as list of dictionaries."""
+    params = _normalize_params(params)
+    cached = _cache_get(sql, params)
+    if cached is not None:
+        return cached
+
+    with pooled_conn() as conn:
+        with conn.cursor() as cur:
+            _execute(conn, cur, sql, params)
+            results = _materialize(cur, cur.fetchall())
+    _cache_set(sql, params, results)
+    return results
+
+
+def _run_query_timed_sync(sql: str, params: tuple) -> tuple[List[Dict[str, Any]], float]:
+    """Run query and return results with execution time in ms.
+
+    Deliberately not a wrapper around _run_query_sync: the slow/fast
+    comparison endpoints measure raw statement execution, so this path
+    must bypass the result cache and the PREPARE fast path - timing a
+    cache hit or a pre-planned statement would be measuring nothing.
+    """
+    with pooled_conn() as conn:
+        with conn.cursor() as cur:
+            start = time.perf_counter()
+            cur.execute(sql, params)
+            rows = cur.fetchall()
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            return _materialize(cur, rows), elapsed_ms
+
+
+async def run_query(sql: str, params: tuple) -> List[Dict[str, Any]]:
+    """Async wrapper: run the blocking driver off the event loop."""
+    return await run_in_threadpool(_run_query_sync, sql, params)
+
+
+async def run_query_timed(sql: str, params: tuple) -> tuple[List[Dict[str, Any]], float]:
+    """Async wrapper around the timed query path."""
+    return await run_in_threadpool(_run_query_timed_sync, sql, params)
+
+
+def _run_query_csv_sync(sql: str, params: tuple) -> bytes:
+    """Stream a query result as CSV via COPY TO STDOUT.
+
+    COPY serializes rows inside the server, so large exports skip the
+    per-cell Python object allocation of the normal fetch path. COPY
+    takes no bind parameters, so the statement is inlined with mogrify
+    (which quotes through libpq) before wrapping.
+    """
+    with pooled_conn() as conn:
+        with conn.cursor() as cur:
+            inlined = cur.mogrify(sql.strip().rstrip(";"), params).decode()
+            buf = io.BytesIO()
+            cur.copy_expert(
+                f"COPY ({inlined}) TO STDOUT WITH (FORMAT csv, HEADER true)",
+                buf,
+            )
+            return buf.getvalue()
+
+
+async def run_query_csv(sql: str, params: tuple) -> bytes:
+    """Async wrapper around the CSV export path."""
+    return await run_in_threadpool(_run_query_csv_sync, sql, params)
+
+
+async def run_many(queries: List[tuple]) -> List[List[Dict[str, Any]]]:
+    """Run several independent queries concurrently.
+
+    Each query takes its own pooled connection and threadpool worker, so
+    a multi-panel dashboard refresh costs roughly the slowest panel
+    instead of the sum of all of them.
+    """
+    return await asyncio.gather(
+        *(run_query(sql, params) for sql, params in queries)
+    )
+
+
+# Shared SQL for the dashboard queries, used by both the individual
+# endpoints and the batched /api/dashboard route
+EVENT_CAR_FAST_SQL = """
+    SELECT
+        symbol,
+        event_ts,
+        min_car,
+        max_car
+    FROM mv_event_car_minmax
+    WHERE symbol = %s
+      AND event_ts BETWEEN %s AND %s
+    ORDER BY event_ts;
+"""
+
+FUNDING_DECILES_SQL = """
+    SELECT
+        rate_decile,
+        AVG(markout_60m) AS avg_markout_60m,
+        COUNT(*) AS n_events
+    FROM mv_funding_decile_markouts
+    WHERE ts BETWEEN %s AND %s
+    GROUP BY rate_decile
+    ORDER BY rate_decile;
+"""
+
+HOURLY_MARKOUTS_SQL = """
+    SELECT
+        funding_hour,
+        AVG(markout_60m) AS avg_markout_60m,
+        COUNT(*) AS n_events
+    FROM mv_event_markouts
+    WHERE event_ts BETWEEN %s AND %s
+    GROUP BY funding_hour
+    ORDER BY funding_hour;
+"""
+
+VOL_REGIME_MARKOUTS_SQL = """
+    SELECT
+        ev.vol_regime,
+        AVG(em.markout_60m) AS avg_markout_60m,
+        COUNT(*) AS n_events
+    FROM mv_event_volatility ev
+    JOIN mv_event_markouts em
+      ON em.symbol = ev.symbol
+     AND em.event_ts = ev.ts
+    WHERE ev.ts BETWEEN %s AND %s
+    GROUP BY ev.vol_regime
+    ORDER BY ev.vol_regime;
+"""
+
+SYMBOL_OVERVIEW_SQL = """
+    SELECT
+        symbol,
+        SUM(n_klines) AS n_klines,
+        SUM(n_funding_events) AS n_funding_events,
+        AVG(avg_volume) AS avg_kline_volume
+    FROM mv_symbol_daily_stats
+    WHERE d BETWEEN %s AND %s
+    GROUP BY symbol
+    ORDER BY symbol;
+"""
+
+POST_EVENT_VOLATILITY_SQL = """
+    SELECT
+        symbol,
+        AVG(rv_1h) AS avg_rv_30m,
+        COUNT(*) AS n_events
+    FROM mv_event_volatility
+    WHERE ts BETWEEN %s AND %s
+    GROUP BY symbol
+    ORDER BY avg_rv_30m DESC;
+"""
+
+# The CTE pipeline lives in the extreme_regimes SQL function
+# (sql/create_functions.sql) so Postgres caches a generic plan instead
+# of replanning the whole pipeline per request
+EXTREME_REGIMES_SQL = "SELECT * FROM extreme_regimes(%s, %s, %s, %s);"
+
+# The 30-minute negative-return flag is precomputed per event in
+# mv_low_vol_safe_symbols, so this is an index range scan plus a hash
+# aggregate - no minute_returns access at request time
+LOW_VOL_SAFE_SYMBOLS_SQL = """
+    WITH median_rv AS (
+        SELECT
+            PERCENTILE_DISC(0.5) WITHIN GROUP (ORDER BY rv_1d) AS med_rv
+        FROM mv_low_vol_safe_symbols
+        WHERE ts BETWEEN %s AND %s
+    )
+    SELECT symbol
+    FROM mv_low_vol_safe_symbols
+    WHERE ts BETWEEN %s AND %s
+    GROUP BY symbol
+    HAVING bool_or(
+        has_neg_30m AND rv_1d < (SELECT med_rv FROM median_rv)
+    ) = false
+    ORDER BY symbol;
+"""
+
+FUNDING_PRESSURE_SQL = """
+    SELECT
+        symbol,
+        AVG(ABS(rate)) AS avg_abs_rate,
+        COUNT(*) AS n_events
+    FROM funding
+    WHERE ts BETWEEN %s AND %s
+    GROUP BY symbol
+    HAVING COUNT(*) >= %s
+    ORDER BY avg_abs_rate DESC
+    LIMIT %s;
+"""
+
+POSITIVE_MOVES_SQL = """
+    SELECT
+        symbol,
+        COUNT(*) AS n_positive_moves
+    FROM mv_event_markouts
+    WHERE event_ts BETWEEN %s AND %s
+      AND markout_60m > %s
+    GROUP BY symbol
+    ORDER BY n_positive_moves DESC;
+"""
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON responses rendered with orjson's C serializer.
+
+    Much faster than the stdlib encoder on the large list-of-dict payloads
+    the analytics endpoints return; _json_default covers the Decimal and
+    datetime values coming out of psycopg2.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_json_default)
+
+
+app = FastAPI(
+    title="Funding-Aware Market Maker API",
+    default_response_class=ORJSONResponse,
+)
+
+
+@app.on_event("startup")
+def open_db_pool() -> None:
+    """Warm the connection pool before serving traffic."""
+    _get_pool()
+
+
+@app.on_event("shutdown")
+def close_db_pool() -> None:
+    global PG_POOL
+    if PG_POOL is not None:
+        PG_POOL.closeall()
+        PG_POOL = None
+
+
+# The symbols list changes only when new data is loaded, so the dropdown
+# endpoint serves an in-memory snapshot refreshed on a timer instead of
+# querying per request.
+SYMBOLS_SQL = """
+    SELECT symbol
+    FROM symbols
+    ORDER BY symbol;
+"""
+
+SYMBOLS_REFRESH_SECONDS = int(os.getenv("SYMBOLS_REFRESH_SECONDS", "300"))
+
+
+async def _refresh_symbols() -> None:
+    app.state.symbols = await run_query(SYMBOLS_SQL, ())
+
+
+async def _refresh_symbols_loop() -> None:
+    while True:
+        try:
+            await _refresh_symbols()
+        except Exception:
+            pass  # keep serving the previous snapshot; retry next tick
+        await asyncio.sleep(SYMBOLS_REFRESH_SECONDS)
+
+
+@app.on_event("startup")
+async def start_symbols_refresh() -> None:
+    app.state.symbols = []
+    app.state.symbols_task = asyncio.create_task(_refresh_symbols_loop())
+
+
+@app.on_event("shutdown")
+async def stop_symbols_refresh() -> None:
+    task = getattr(app.state, "symbols_task", None)
+    if task is not None:
+        task.cancel()
 
 # CORS configuration for frontend access
 FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:5173")
-allowed_origins = [
-    "http://localhost:5173",
-    "http://127.0.0.1:5173",
-]
-
-# Add production frontend URL with/without trailing slash
-if FRONTEND_URL and FRONTEND_URL not in allowed_origins:
-    allowed_origins.append(FRONTEND_URL)
-    if FRONTEND_URL.endswith("/"):
-        allowed_origins.append(FRONTEND_URL.rstrip("/"))
-    else:
-        allowed_origins.append(FRONTEND_URL + "/")
+
+
+def _allowed_origins(frontend_url: str) -> frozenset:
+    """Dev origins plus the production frontend with/without slash."""
+    return frozenset(
+        filter(
+            None,
+            [
+                "http://localhost:5173",
+                "http://127.0.0.1:5173",
+                frontend_url,
+                frontend_url.rstrip("/"),
+                frontend_url.rstrip("/") + "/" if frontend_url else "",
+            ],
+        )
+    )
+
+
+ALLOWED_ORIGINS = _allowed_origins(FRONTEND_URL)
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=allowed_origins,
+    allow_origins=sorted(ALLOWED_ORIGINS),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Compress the big list responses: their JSON is mostly repeated symbol
+# strings and key names, which gzip shrinks by an order of magnitude.
+# Small payloads skip compression entirely.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+
+def _response_etag() -> str:
+    """Validator for the analytics responses.
+
+    Rolls over once per cache-TTL window and whenever the result cache
+    is explicitly invalidated, so a 304 can never outlive the server
+    caches' own staleness bound.
+    """
+    return f'W/"{CACHE_GENERATION}-{int(time.time() // QUERY_CACHE_TTL)}"'
+
+
+@app.middleware("http")
+async def etag_cache_headers(request: Request, call_next):
+    """Let polling clients revalidate instead of refetching.
+
+    Dashboard clients re-request identical ranges every few seconds;
+    within a cache window the bytes cannot change, so a matching
+    If-None-Match short-circuits to 304 without touching the database.
+    The slow/fast timing routes are excluded - they exist to measure
+    query execution.
+    """
+    path = request.url.path
+    if (
+        request.method != "GET"
+        or not path.startswith("/api/")
+        or path.startswith(("/api/auth", "/api/slow", "/api/fast"))
+    ):
+        return await call_next(request)
+
+    etag = _response_etag()
+    cache_headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={QUERY_CACHE_TTL}",
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=cache_headers)
+    response = await call_next(request)
+    if response.status_code == 200:
+        response.headers.update(cache_headers)
+    return response
+
 
 @app.get("/health")
 def health() -> Dict[str, str]:
@@ -163,261 +700,241 @@ async def get_current_user(user_data: Dict = Depends(verify_token)):
 
 
 @app.get("/api/symbols")
-def list_symbols() -> List[Dict[str, Any]]:
-    """Get all available trading symbols."""
-    sql = """
-        SELECT symbol
-        FROM symbols
-        ORDER BY symbol;
+async def list_symbols() -> List[Dict[str, Any]]:
+    """Get all available trading symbols from the in-memory snapshot."""
+    if not app.state.symbols:
+        # Cold start before the first timer tick lands
+        await _refresh_symbols()
+    return app.state.symbols
+
+
+@app.post("/api/symbols/refresh")
+async def refresh_symbols() -> Dict[str, Any]:
+    """Force an immediate reload of the symbols snapshot."""
+    await _refresh_symbols()
+    return {"n_symbols": len(app.state.symbols)}
+
+
+# The window every frontend page ships with as its default date range
+# (frontend/src/pages/*: startDate/endDate useState defaults, sent as
+# ...T00:00:00Z / ...T23:59:59Z). Warmed keys must match those first
+# requests' params exactly after normalization, or the warm pass
+# primes entries nothing ever reads.
+WARM_START_TS = datetime(2024, 1, 1, 0, 0, 0)
+WARM_END_TS = datetime(2024, 1, 31, 23, 59, 59)
+
+
+async def _warm_cache() -> None:
+    """Re-prime the result cache for the frontend's default window.
+
+    Every page first loads with the same default date range, so running
+    those panel queries once at invalidation time means the first
+    post-refresh dashboard hit is served from cache instead of paying
+    the cold query cost.
     """
-    return run_query(sql, ())
+    await run_many([
+        (FUNDING_DECILES_SQL, (WARM_START_TS, WARM_END_TS)),
+        (HOURLY_MARKOUTS_SQL, (WARM_START_TS, WARM_END_TS)),
+        (VOL_REGIME_MARKOUTS_SQL, (WARM_START_TS, WARM_END_TS)),
+        (SYMBOL_OVERVIEW_SQL, (WARM_START_TS, WARM_END_TS)),
+        (POST_EVENT_VOLATILITY_SQL, (WARM_START_TS, WARM_END_TS)),
+    ])
+
+
+def _invalidate_cache_sync() -> None:
+    global CACHE_GENERATION
+    CACHE_GENERATION += 1
+    with LOCAL_CACHE_LOCK:
+        LOCAL_CACHE.clear()
+    if REDIS_CLIENT is not None:
+        try:
+            keys = REDIS_CLIENT.keys("query_cache:*")
+            if keys:
+                REDIS_CLIENT.delete(*keys)
+        except Exception:
+            pass
+
+
+@app.post("/api/admin/invalidate_cache")
+async def invalidate_cache(user_data: Dict = Depends(verify_token)) -> Dict[str, str]:
+    """Drop all cached query results. Requires a valid JWT.
+
+    Called by the materialized-view refresh cron (which sends a bearer
+    token) so dashboards pick up fresh data immediately instead of
+    waiting out the TTL. The default-window panels are re-primed before
+    returning, so the next dashboard load lands on a warm cache.
+    """
+    await run_in_threadpool(_invalidate_cache_sync)
+    try:
+        await _warm_cache()
+    except HTTPException:
+        pass  # invalidation succeeded; warming is best-effort
+    return {"status": "cleared"}
 
 
 # Optimized query endpoints using materialized views
 @app.get("/api/event_car")
-def get_event_car(
+async def get_event_car(
     symbol: str,
     start_ts: datetime,
     end_ts: datetime,
 ) -> List[Dict[str, Any]]:
     """Return min/max CAR for each funding event using pre-computed view."""
-    # Uses mv_event_car to avoid recalculating window functions
-    sql = """
-        SELECT
-            symbol,
-            event_ts,
-            MIN(car) AS min_car,
-            MAX(car) AS max_car
-        FROM mv_event_car
-        WHERE symbol = %s
-          AND event_ts BETWEEN %s AND %s
-        GROUP BY symbol, event_ts
-        ORDER BY event_ts;
-    """
-    return run_query(sql, (symbol, start_ts, end_ts))
+    # The per-event extremes are materialized in mv_event_car_minmax:
+    # one row per event instead of ~240 series rows, no aggregation at
+    # request time
+    return await run_query(EVENT_CAR_FAST_SQL, (symbol, start_ts, end_ts))
 
 
 @app.get("/api/funding_deciles")
-def get_funding_deciles(
+async def get_funding_deciles(
     start_ts: datetime,
     end_ts: datetime,
 ) -> List[Dict[str, Any]]:
     """Analyze funding rate deciles vs 60-minute markouts."""
-    sql = """
-        SELECT
-            fd.rate_decile,
-            AVG(em.markout_60m) AS avg_markout_60m,
-            COUNT(*) AS n_events
-        FROM mv_funding_deciles fd
-        JOIN mv_event_markouts em
-          ON em.symbol = fd.symbol
-         AND em.event_ts = fd.ts
-        WHERE fd.ts BETWEEN %s AND %s
-        GROUP BY fd.rate_decile
-        ORDER BY fd.rate_decile;
-    """
-    return run_query(sql, (start_ts, end_ts))
+    return await run_query(FUNDING_DECILES_SQL, (start_ts, end_ts))
 
 
 @app.get("/api/extreme_regimes")
-def get_extreme_regimes(
+async def get_extreme_regimes(
     start_ts: datetime,
     end_ts: datetime,
     min_events: int = 5,
     top_k: int = 10,
 ) -> List[Dict[str, Any]]:
     """Identify symbols with extreme funding regimes."""
-    # Finds events where both |funding rate| and OI are above 90th percentile
-    sql = """
-        WITH regime_events AS (
-            SELECT
-                f.symbol,
-                f.ts
-            FROM funding f
-            JOIN mv_daily_rate_stats dr
-              ON dr.symbol = f.symbol
-             AND dr.d = DATE(f.ts)
-            JOIN mv_rolling_oi_stats oi
-              ON oi.symbol = f.symbol
-             AND oi.ts = f.ts
-            WHERE f.ts BETWEEN %s AND %s
-              AND ABS(f.rate) > dr.p90_abs_rate
-              AND oi.oi > oi.p90_oi_14d
-        )
-        SELECT
-            r.symbol,
-            AVG(em.markout_60m) AS avg_markout_60m,
-            COUNT(*) AS n_events
-        FROM regime_events r
-        JOIN mv_event_markouts em
-          ON em.symbol = r.symbol
-         AND em.event_ts = r.ts
-        GROUP BY r.symbol
-        HAVING COUNT(*) >= %s
-        ORDER BY avg_markout_60m DESC
-        LIMIT %s;
-    """
-    return run_query(sql, (start_ts, end_ts, min_events, top_k))
+    # Finds events where both |funding rate| and OI are above 90th
+    # percentile
+    return await run_query(
+        EXTREME_REGIMES_SQL, (start_ts, end_ts, min_events, top_k)
+    )
 
 
 @app.get("/api/low_vol_safe_symbols")
-def get_low_vol_safe_symbols(
+async def get_low_vol_safe_symbols(
     start_ts: datetime,
     end_ts: datetime,
 ) -> List[Dict[str, Any]]:
     """Find symbols with no negative CAR during low volatility."""
-    # Identifies "safe" symbols that maintain positive returns in calm markets
-    sql = """
-        WITH median_rv AS (
-            SELECT
-                PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY rv_1d) AS med_rv
-            FROM mv_event_volatility
-            WHERE ts BETWEEN %s AND %s
-        )
-        SELECT DISTINCT ev.symbol
-        FROM mv_event_volatility ev,
-             median_rv m
-        WHERE ev.ts BETWEEN %s AND %s
-          AND NOT EXISTS (
-            SELECT 1
-            FROM minute_returns mr
-            WHERE mr.symbol = ev.symbol
-              AND mr.ts > ev.ts
-              AND mr.ts <= ev.ts + INTERVAL '30 minutes'
-              AND mr.r1m < 0
-              AND ev.rv_1d < m.med_rv
-        )
-        ORDER BY ev.symbol;
-    """
-    return run_query(sql, (start_ts, end_ts, start_ts, end_ts))
+    return await run_query(
+        LOW_VOL_SAFE_SYMBOLS_SQL, (start_ts, end_ts, start_ts, end_ts)
+    )
 
 
 @app.get("/api/hourly_markouts")
-def get_hourly_markouts(
+async def get_hourly_markouts(
     start_ts: datetime,
     end_ts: datetime,
 ) -> List[Dict[str, Any]]:
     """Analyze average 60-minute markouts by hour of day."""
-    sql = """
-        SELECT
-            EXTRACT(HOUR FROM event_ts) AS funding_hour,
-            AVG(markout_60m) AS avg_markout_60m,
-            COUNT(*) AS n_events
-        FROM mv_event_markouts
-        WHERE event_ts BETWEEN %s AND %s
-        GROUP BY funding_hour
-        ORDER BY funding_hour;
-    """
-    return run_query(sql, (start_ts, end_ts))
+    return await run_query(HOURLY_MARKOUTS_SQL, (start_ts, end_ts))
 
 
 @app.get("/api/vol_regime_markouts")
-def get_vol_regime_markouts(
+async def get_vol_regime_markouts(
     start_ts: datetime,
     end_ts: datetime,
 ) -> List[Dict[str, Any]]:
     """Analyze markouts by volatility regime."""
-    sql = """
-        SELECT
-            ev.vol_regime,
-            AVG(em.markout_60m) AS avg_markout_60m,
-            COUNT(*) AS n_events
-        FROM mv_event_volatility ev
-        JOIN mv_event_markouts em
-          ON em.symbol = ev.symbol
-         AND em.event_ts = ev.ts
-        WHERE ev.ts BETWEEN %s AND %s
-        GROUP BY ev.vol_regime
-        ORDER BY ev.vol_regime;
-    """
-    return run_query(sql, (start_ts, end_ts))
+    return await run_query(VOL_REGIME_MARKOUTS_SQL, (start_ts, end_ts))
 
 
 @app.get("/api/symbol_overview")
-def get_symbol_overview(
+async def get_symbol_overview(
     start_ts: datetime,
     end_ts: datetime,
-) -> List[Dict[str, Any]]:
-    """Get aggregated statistics for all symbols."""
-    sql = """
-        SELECT
-            symbol,
-            SUM(n_klines) AS n_klines,
-            SUM(n_funding_events) AS n_funding_events,
-            AVG(avg_volume) AS avg_kline_volume
-        FROM mv_symbol_daily_stats
-        WHERE d BETWEEN %s AND %s
-        GROUP BY symbol
-        ORDER BY symbol;
+    format: str = "json",
+):
+    """Get aggregated statistics for all symbols.
+
+    format=csv streams the result through COPY, avoiding per-row Python
+    objects on the largest responses.
     """
-    return run_query(sql, (start_ts, end_ts))
+    if format == "csv":
+        body = await run_query_csv(SYMBOL_OVERVIEW_SQL, (start_ts, end_ts))
+        return Response(content=body, media_type="text/csv")
+    return await run_query(SYMBOL_OVERVIEW_SQL, (start_ts, end_ts))
 
 
 @app.get("/api/funding_pressure")
-def get_funding_pressure(
+async def get_funding_pressure(
     start_ts: datetime,
     end_ts: datetime,
     min_events: int = 10,
     top_k: int = 10,
 ) -> List[Dict[str, Any]]:
     """Rank symbols by average absolute funding rate."""
-    sql = """
-        SELECT
-            symbol,
-            AVG(ABS(rate)) AS avg_abs_rate,
-            COUNT(*) AS n_events
-        FROM funding
-        WHERE ts BETWEEN %s AND %s
-        GROUP BY symbol
-        HAVING COUNT(*) >= %s
-        ORDER BY avg_abs_rate DESC
-        LIMIT %s;
-    """
-    return run_query(sql, (start_ts, end_ts, min_events, top_k))
+    return await run_query(
+        FUNDING_PRESSURE_SQL, (start_ts, end_ts, min_events, top_k)
+    )
 
 
 @app.get("/api/post_event_volatility")
-def get_post_event_volatility(
+async def get_post_event_volatility(
     start_ts: datetime,
     end_ts: datetime,
-) -> List[Dict[str, Any]]:
-    """Average pre-event volatility by symbol."""
-    sql = """
-        SELECT
-            symbol,
-            AVG(rv_1h) AS avg_rv_30m,
-            COUNT(*) AS n_events
-        FROM mv_event_volatility
-        WHERE ts BETWEEN %s AND %s
-        GROUP BY symbol
-        ORDER BY avg_rv_30m DESC;
+    format: str = "json",
+):
+    """Average pre-event volatility by symbol.
+
+    format=csv streams the result through COPY, avoiding per-row Python
+    objects on the largest responses.
     """
-    return run_query(sql, (start_ts, end_ts))
+    if format == "csv":
+        body = await run_query_csv(POST_EVENT_VOLATILITY_SQL, (start_ts, end_ts))
+        return Response(content=body, media_type="text/csv")
+    return await run_query(POST_EVENT_VOLATILITY_SQL, (start_ts, end_ts))
 
 
 @app.get("/api/positive_moves")
-def get_positive_moves(
+async def get_positive_moves(
     start_ts: datetime,
     end_ts: datetime,
     threshold: float = 0.0,
 ) -> List[Dict[str, Any]]:
     """Count events where 60-minute markout exceeds threshold."""
-    sql = """
-        SELECT
-            symbol,
-            COUNT(*) AS n_positive_moves
-        FROM mv_event_markouts
-        WHERE event_ts BETWEEN %s AND %s
-          AND markout_60m > %s
-        GROUP BY symbol
-        ORDER BY n_positive_moves DESC;
+    return await run_query(POSITIVE_MOVES_SQL, (start_ts, end_ts, threshold))
+
+
+@app.get("/api/dashboard")
+async def get_dashboard(
+    start_ts: datetime,
+    end_ts: datetime,
+    threshold: float = 0.0,
+    symbol: str | None = None,
+    min_events: int = 5,
+    top_k: int = 10,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Batched dashboard data: all date-range panels in one request.
+
+    Saves one HTTP round trip per panel and runs the panel queries
+    concurrently, so the response takes about as long as the slowest
+    panel instead of the sum of all of them. Passing symbol adds that
+    symbol's event CAR series to the payload.
     """
-    return run_query(sql, (start_ts, end_ts, threshold))
+    names_and_queries = [
+        ("funding_deciles", (FUNDING_DECILES_SQL, (start_ts, end_ts))),
+        ("hourly_markouts", (HOURLY_MARKOUTS_SQL, (start_ts, end_ts))),
+        ("vol_regime_markouts", (VOL_REGIME_MARKOUTS_SQL, (start_ts, end_ts))),
+        ("symbol_overview", (SYMBOL_OVERVIEW_SQL, (start_ts, end_ts))),
+        ("post_event_volatility", (POST_EVENT_VOLATILITY_SQL, (start_ts, end_ts))),
+        ("positive_moves", (POSITIVE_MOVES_SQL, (start_ts, end_ts, threshold))),
+        (
+            "extreme_regimes",
+            (EXTREME_REGIMES_SQL, (start_ts, end_ts, min_events, top_k)),
+        ),
+    ]
+    if symbol is not None:
+        names_and_queries.append(
+            ("event_car", (EVENT_CAR_FAST_SQL, (symbol, start_ts, end_ts)))
+        )
+    results = await run_many([q for _name, q in names_and_queries])
+    return {name: rows for (name, _q), rows in zip(names_and_queries, results)}
 
 
 # Unoptimized query endpoints for performance comparison
 @app.get("/api/slow/event_car")
-def get_event_car_slow(
+async def get_event_car_slow(
     symbol: str,
     start_ts: datetime,
     end_ts: datetime,
@@ -470,12 +987,12 @@ def get_event_car_slow(
         GROUP BY symbol, event_ts
         ORDER BY event_ts;
     """
-    results, elapsed_ms = run_query_timed(sql, (symbol, start_ts, end_ts))
+    results, elapsed_ms = await run_query_timed(sql, (symbol, start_ts, end_ts))
     return {"results": results, "execution_time_ms": elapsed_ms}
 
 
 @app.get("/api/slow/funding_deciles")
-def get_funding_deciles_slow(
+async def get_funding_deciles_slow(
     start_ts: datetime,
     end_ts: datetime,
 ) -> Dict[str, Any]:
@@ -514,12 +1031,12 @@ def get_funding_deciles_slow(
         GROUP BY rate_decile
         ORDER BY rate_decile;
     """
-    results, elapsed_ms = run_query_timed(sql, (start_ts, end_ts))
+    results, elapsed_ms = await run_query_timed(sql, (start_ts, end_ts))
     return {"results": results, "execution_time_ms": elapsed_ms}
 
 
 @app.get("/api/slow/hourly_markouts")
-def get_hourly_markouts_slow(
+async def get_hourly_markouts_slow(
     start_ts: datetime,
     end_ts: datetime,
 ) -> Dict[str, Any]:
@@ -546,12 +1063,12 @@ def get_hourly_markouts_slow(
         GROUP BY funding_hour
         ORDER BY funding_hour;
     """
-    results, elapsed_ms = run_query_timed(sql, (start_ts, end_ts))
+    results, elapsed_ms = await run_query_timed(sql, (start_ts, end_ts))
     return {"results": results, "execution_time_ms": elapsed_ms}
 
 
 @app.get("/api/slow/vol_regime_markouts")
-def get_vol_regime_markouts_slow(
+async def get_vol_regime_markouts_slow(
     start_ts: datetime,
     end_ts: datetime,
 ) -> Dict[str, Any]:
@@ -601,12 +1118,12 @@ def get_vol_regime_markouts_slow(
         GROUP BY vol_regime
         ORDER BY vol_regime;
     """
-    results, elapsed_ms = run_query_timed(sql, (start_ts, end_ts, start_ts, end_ts))
+    results, elapsed_ms = await run_query_timed(sql, (start_ts, end_ts, start_ts, end_ts))
     return {"results": results, "execution_time_ms": elapsed_ms}
 
 
 @app.get("/api/slow/symbol_overview")
-def get_symbol_overview_slow(
+async def get_symbol_overview_slow(
     start_ts: datetime,
     end_ts: datetime,
 ) -> Dict[str, Any]:
@@ -639,116 +1156,59 @@ def get_symbol_overview_slow(
         GROUP BY s.symbol
         ORDER BY s.symbol;
     """
-    results, elapsed_ms = run_query_timed(sql, (start_ts, end_ts))
+    results, elapsed_ms = await run_query_timed(sql, (start_ts, end_ts))
+    return {"results": results, "execution_time_ms": elapsed_ms}
+
+
+# Optimized query endpoints with timing for performance dashboard.
+# Each reuses the module-level SQL constant of its untimed counterpart,
+# so both routes share one statement text (and one prepared plan).
+async def _timed_payload(sql: str, params: tuple) -> Dict[str, Any]:
+    results, elapsed_ms = await run_query_timed(sql, params)
     return {"results": results, "execution_time_ms": elapsed_ms}
 
 
-# Optimized query endpoints with timing for performance dashboard
 @app.get("/api/fast/event_car")
-def get_event_car_fast_timed(
+async def get_event_car_fast_timed(
     symbol: str,
     start_ts: datetime,
     end_ts: datetime,
 ) -> Dict[str, Any]:
     """Fast event CAR with timing."""
-    sql = """
-        SELECT
-            symbol,
-            event_ts,
-            MIN(car) AS min_car,
-            MAX(car) AS max_car
-        FROM mv_event_car
-        WHERE symbol = %s
-          AND event_ts BETWEEN %s AND %s
-        GROUP BY symbol, event_ts
-        ORDER BY event_ts;
-    """
-    results, elapsed_ms = run_query_timed(sql, (symbol, start_ts, end_ts))
-    return {"results": results, "execution_time_ms": elapsed_ms}
+    return await _timed_payload(EVENT_CAR_FAST_SQL, (symbol, start_ts, end_ts))
 
 
 @app.get("/api/fast/funding_deciles")
-def get_funding_deciles_fast_timed(
+async def get_funding_deciles_fast_timed(
     start_ts: datetime,
     end_ts: datetime,
 ) -> Dict[str, Any]:
     """Fast funding deciles with timing."""
-    sql = """
-        SELECT
-            fd.rate_decile,
-            AVG(em.markout_60m) AS avg_markout_60m,
-            COUNT(*) AS n_events
-        FROM mv_funding_deciles fd
-        JOIN mv_event_markouts em
-          ON em.symbol = fd.symbol
-         AND em.event_ts = fd.ts
-        WHERE fd.ts BETWEEN %s AND %s
-        GROUP BY fd.rate_decile
-        ORDER BY fd.rate_decile;
-    """
-    results, elapsed_ms = run_query_timed(sql, (start_ts, end_ts))
-    return {"results": results, "execution_time_ms": elapsed_ms}
+    return await _timed_payload(FUNDING_DECILES_SQL, (start_ts, end_ts))
 
 
 @app.get("/api/fast/hourly_markouts")
-def get_hourly_markouts_fast_timed(
+async def get_hourly_markouts_fast_timed(
     start_ts: datetime,
     end_ts: datetime,
 ) -> Dict[str, Any]:
     """Fast hourly markouts with timing."""
-    sql = """
-        SELECT
-            EXTRACT(HOUR FROM event_ts) AS funding_hour,
-            AVG(markout_60m) AS avg_markout_60m,
-            COUNT(*) AS n_events
-        FROM mv_event_markouts
-        WHERE event_ts BETWEEN %s AND %s
-        GROUP BY funding_hour
-        ORDER BY funding_hour;
-    """
-    results, elapsed_ms = run_query_timed(sql, (start_ts, end_ts))
-    return {"results": results, "execution_time_ms": elapsed_ms}
+    return await _timed_payload(HOURLY_MARKOUTS_SQL, (start_ts, end_ts))
 
 
 @app.get("/api/fast/vol_regime_markouts")
-def get_vol_regime_markouts_fast_timed(
+async def get_vol_regime_markouts_fast_timed(
     start_ts: datetime,
     end_ts: datetime,
 ) -> Dict[str, Any]:
     """Fast volatility regime markouts with timing."""
-    sql = """
-        SELECT
-            ev.vol_regime,
-            AVG(em.markout_60m) AS avg_markout_60m,
-            COUNT(*) AS n_events
-        FROM mv_event_volatility ev
-        JOIN mv_event_markouts em
-          ON em.symbol = ev.symbol
-         AND em.event_ts = ev.ts
-        WHERE ev.ts BETWEEN %s AND %s
-        GROUP BY ev.vol_regime
-        ORDER BY ev.vol_regime;
-    """
-    results, elapsed_ms = run_query_timed(sql, (start_ts, end_ts))
-    return {"results": results, "execution_time_ms": elapsed_ms}
+    return await _timed_payload(VOL_REGIME_MARKOUTS_SQL, (start_ts, end_ts))
 
 
 @app.get("/api/fast/symbol_overview")
-def get_symbol_overview_fast_timed(
+async def get_symbol_overview_fast_timed(
     start_ts: datetime,
     end_ts: datetime,
 ) -> Dict[str, Any]:
     """Fast symbol overview with timing."""
-    sql = """
-        SELECT
-            symbol,
-            SUM(n_klines) AS n_klines,
-            SUM(n_funding_events) AS n_funding_events,
-            AVG(avg_volume) AS avg_kline_volume
-        FROM mv_symbol_daily_stats
-        WHERE d BETWEEN %s AND %s
-        GROUP BY symbol
-        ORDER BY symbol;
-    """
-    results, elapsed_ms = run_query_timed(sql, (start_ts, end_ts))
-    return {"results": results, "execution_time_ms": elapsed_ms}
+    return await _timed_payload(SYMBOL_OVERVIEW_SQL, (start_ts, end_ts))
@@ -3,6 +3,8 @@ import csv
 from datetime import datetime, timedelta
 import random
 
+import numpy as np
+
 # Configuration for synthetic data generation
 SYMBOLS = ["BTCUSDT", "ETHUSDT"]
 START = datetime(2024, 1, 1, 0, 0, 0)
@@ -26,20 +28,32 @@ def drange(start, end, delta):
 
 def generate_funding_rows():
     """Generate synthetic funding rates for all symbols."""
+    rng = np.random.default_rng()
+    ts_list = list(drange(START, END, timedelta(hours=FUNDING_INTERVAL_HOURS)))
+    n = len(ts_list)
+
     rows = []
     for sym in SYMBOLS:
-        # Add small bias to simulate directional funding pressure
+        # Add small bias to simulate directional funding pressure;
+        # rates drawn with realistic variance (~1.5 basis points)
         bias = random.uniform(-0.00002, 0.00002)
-        for ts in drange(START, END, timedelta(hours=FUNDING_INTERVAL_HOURS)):
-            # Generate rates with realistic variance (~1.5 basis points)
-            rate = bias + random.gauss(0.0, 0.00015)
-            rows.append((sym, ts, rate))
+        rates = bias + rng.normal(0.0, 0.00015, n)
+        rows.extend(zip([sym] * n, ts_list, rates.tolist()))
     return rows
 
 
 def generate_open_interest_rows(funding_rows):
-    """Generate synthetic open interest with boosted values at funding timestamps."""
-    rows = []
+    """Generate synthetic open interest with boosted values at funding timestamps.
+
+    The random walk is drawn as one vectorized log-walk per symbol;
+    level-proportional additive noise becomes a multiplicative step,
+    which keeps the same ~0.05% per-step volatility without a Python
+    loop over every timestep.
+    """
+    rng = np.random.default_rng()
+    step = timedelta(minutes=OI_INTERVAL_MINUTES)
+    ts_list = list(drange(START, END, step))
+    n = len(ts_list)
 
     # Realistic base OI levels for each symbol
     base_levels = {
@@ -47,69 +61,85 @@ def generate_open_interest_rows(funding_rows):
         "ETHUSDT": 60_000.0,
     }
 
-    # Generate OI time series with random walk
-    for sym in SYMBOLS:
-        level = base_levels.get(sym, 50_000.0)
-        for ts in drange(START, END, timedelta(minutes=OI_INTERVAL_MINUTES)):
-            # Random walk with small volatility
-            level += random.gauss(0.0, level * 0.0005)
-            # Keep OI within reasonable bounds
-            level = max(1_000.0, min(level, 2_000_000.0))
-            rows.append((sym, ts, level))
-
-    # Boost OI at funding timestamps to create regime events
-    funding_ts_by_symbol = {}
+    # Funding events land exactly on the OI grid, so the boost targets
+    # are direct index positions rather than per-row set membership tests
+    funding_idx_by_symbol = {}
     for sym, ts, _rate in funding_rows:
-        funding_ts_by_symbol.setdefault(sym, set()).add(ts)
+        offset = ts - START
+        if START <= ts <= END and offset % step == timedelta(0):
+            funding_idx_by_symbol.setdefault(sym, []).append(offset // step)
 
-    boosted_rows = []
-    for (sym, ts, oi) in rows:
-        # Increase OI by 5-20% during funding events
-        if ts in funding_ts_by_symbol.get(sym, set()):
-            oi *= random.uniform(1.05, 1.20)
-        boosted_rows.append((sym, ts, oi))
+    rows = []
+    for sym in SYMBOLS:
+        base = base_levels.get(sym, 50_000.0)
+        # Random walk with small volatility, within reasonable bounds
+        levels = base * np.exp(np.cumsum(rng.normal(0.0, 0.0005, n)))
+        np.clip(levels, 1_000.0, 2_000_000.0, out=levels)
 
-    return boosted_rows
+        # Increase OI by 5-20% during funding events, in place - no
+        # second boosted-rows pass over the series
+        idx = np.asarray(funding_idx_by_symbol.get(sym, ()), dtype=np.intp)
+        if idx.size:
+            levels[idx] *= rng.uniform(1.05, 1.20, idx.size)
+
+        rows.extend(zip([sym] * n, ts_list, levels.tolist()))
+
+    return rows
 
 
 def generate_premium_index_rows():
-    """Generate synthetic premium index OHLC data."""
+    """Generate synthetic premium index OHLC data.
+
+    Each close carries as the next bar's level, so the close series is
+    the running sum of per-bar innovations - one cumsum per symbol
+    instead of per-bar Python arithmetic.
+    """
+    rng = np.random.default_rng()
+    ts_list = list(drange(START, END, timedelta(minutes=PREMIUM_INTERVAL_MINUTES)))
+    n = len(ts_list)
+
     rows = []
     for sym in SYMBOLS:
         level = random.uniform(-0.005, 0.005)
-        for ts in drange(START, END, timedelta(minutes=PREMIUM_INTERVAL_MINUTES)):
-            # Generate OHLC bars with realistic spread
-            close_val = level + random.gauss(0.0, 0.0005)
-            high_val = close_val + abs(random.gauss(0.0, 0.0003))
-            low_val = close_val - abs(random.gauss(0.0, 0.0003))
-            open_val = (high_val + low_val) / 2.0
-
-            # Clamp values to [-5%, +5%] range
-            for_val = lambda x: max(-0.05, min(0.05, x))
-            open_val = for_val(open_val)
-            high_val = for_val(high_val)
-            low_val = for_val(low_val)
-            close_val = for_val(close_val)
-
-            rows.append((sym, ts, open_val, high_val, low_val, close_val))
-            # Carry close as next level for drift
-            level = close_val
+        # Generate OHLC bars with realistic spread
+        close = level + np.cumsum(rng.normal(0.0, 0.0005, n))
+        high = close + np.abs(rng.normal(0.0, 0.0003, n))
+        low = close - np.abs(rng.normal(0.0, 0.0003, n))
+        open_ = (high + low) / 2.0
+
+        # Clamp values to [-5%, +5%] range
+        for arr in (open_, high, low, close):
+            np.clip(arr, -0.05, 0.05, out=arr)
+
+        rows.extend(
+            zip(
+                [sym] * n,
+                ts_list,
+                open_.tolist(),
+                high.tolist(),
+                low.tolist(),
+                close.tolist(),
+            )
+        )
 
     return rows
 
 
 def write_csv(path, header, rows):
-    with open(path, "w", newline="") as f:
+    """Write rows as CSV, formatting the timestamp column once per row.
+
+    Every row shape here is (symbol, ts, *values), so only column 1
+    needs datetime formatting; writerows over a generator avoids the
+    per-row writerow call and the per-cell isinstance check.
+    """
+    # 1MB buffer coalesces the writer's many small writes into a few
+    # large syscalls
+    with open(path, "w", newline="", buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow(header)
-        for r in rows:
-            out = []
-            for v in r:
-                if isinstance(v, datetime):
-                    out.append(v.isoformat(sep=" "))
-                else:
-                    out.append(v)
-            writer.writerow(out)
+        writer.writerows(
+            (r[0], r[1].isoformat(sep=" "), *r[2:]) for r in rows
+        )
 
 
 def main():
@@ -0,0 +1,52 @@
+SET search_path TO public;
+
+-- Server-side SQL functions wrapping the most complex parameterized
+-- queries. A STABLE SQL function switches to a cached generic plan
+-- after a few calls, so the regime-detection CTE below is planned once
+-- per backend connection instead of on every request.
+--
+-- Run after the milestone 4 materialized views exist.
+
+CREATE OR REPLACE FUNCTION extreme_regimes(
+    p_start_ts   TIMESTAMP,
+    p_end_ts     TIMESTAMP,
+    p_min_events INTEGER,
+    p_top_k      INTEGER
+)
+RETURNS TABLE (
+    symbol          TEXT,
+    avg_markout_60m DOUBLE PRECISION,
+    n_events        BIGINT
+)
+LANGUAGE sql STABLE AS $$
+    WITH regime_events AS (
+        -- The percentile joins are precomputed in
+        -- mv_extreme_regime_events; this is just a range scan
+        SELECT
+            e.symbol,
+            e.ts
+        FROM mv_extreme_regime_events e
+        WHERE e.ts BETWEEN p_start_ts AND p_end_ts
+    ),
+    qualifying AS (
+        -- Apply the min-events filter before touching the markouts,
+        -- so the join below only runs for symbols that can appear
+        SELECT re.symbol
+        FROM regime_events re
+        GROUP BY re.symbol
+        HAVING COUNT(*) >= p_min_events
+    )
+    SELECT
+        r.symbol,
+        AVG(em.markout_60m) AS avg_markout_60m,
+        COUNT(*) AS n_events
+    FROM regime_events r
+    JOIN qualifying q
+      ON q.symbol = r.symbol
+    JOIN mv_event_markouts em
+      ON em.symbol = r.symbol
+     AND em.event_ts = r.ts
+    GROUP BY r.symbol
+    ORDER BY avg_markout_60m DESC
+    LIMIT p_top_k;
+$$;
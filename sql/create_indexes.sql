@@ -0,0 +1,54 @@
+SET search_path TO public;
+
+-- Performance indexes beyond the primary keys in create_tables.sql.
+-- Covering (INCLUDE) indexes let the hot joins run as index-only scans;
+-- BRIN indexes give cheap pruning on the append-only time columns at a
+-- fraction of the size of a btree.
+
+-- klines: minute_returns is a view over klines, so this is also the
+-- (symbol, ts) range index behind every minute_returns join; the view
+-- only needs close_price per (symbol, open_time), and the daily stats
+-- roll up volume
+CREATE INDEX IF NOT EXISTS idx_klines_sym_time_cover
+    ON klines(symbol, open_time) INCLUDE (close_price, volume);
+
+CREATE INDEX IF NOT EXISTS idx_klines_time_brin
+    ON klines USING brin(open_time);
+
+-- funding: every event-study query joins on (symbol, ts) and reads rate
+CREATE INDEX IF NOT EXISTS idx_funding_sym_ts_cover
+    ON funding(symbol, ts) INCLUDE (rate);
+
+CREATE INDEX IF NOT EXISTS idx_funding_ts_brin
+    ON funding USING brin(ts);
+
+-- open_interest: regime detection joins on (symbol, ts) and reads oi
+CREATE INDEX IF NOT EXISTS idx_oi_sym_ts_cover
+    ON open_interest(symbol, ts) INCLUDE (oi);
+
+CREATE INDEX IF NOT EXISTS idx_oi_ts_brin
+    ON open_interest USING brin(ts);
+
+CREATE INDEX IF NOT EXISTS idx_premium_ts_brin
+    ON premium_index USING brin(ts);
+
+-- Materialized views: cover the markout aggregations so range queries
+-- never touch the heap
+CREATE INDEX IF NOT EXISTS idx_mv_event_markouts_ts_cover
+    ON mv_event_markouts(event_ts) INCLUDE (symbol, funding_hour, markout_60m);
+
+CREATE INDEX IF NOT EXISTS idx_mv_event_volatility_ts_cover
+    ON mv_event_volatility(ts) INCLUDE (symbol, rv_1d, vol_regime);
+
+-- MVs whose only btree leads with symbol (or day) still need cheap
+-- pruning for plain time-range filters; BRIN does that at a fraction
+-- of a btree's size. mv_event_car is by far the largest MV (one row
+-- per event-minute), so it matters most there.
+CREATE INDEX IF NOT EXISTS idx_mv_event_car_ts_brin
+    ON mv_event_car USING brin(event_ts) WITH (pages_per_range = 32);
+
+CREATE INDEX IF NOT EXISTS idx_mv_rolling_oi_stats_ts_brin
+    ON mv_rolling_oi_stats USING brin(ts) WITH (pages_per_range = 32);
+
+CREATE INDEX IF NOT EXISTS idx_mv_symbol_daily_stats_d_brin
+    ON mv_symbol_daily_stats USING brin(d) WITH (pages_per_range = 32);
@@ -25,27 +25,37 @@ CREATE INDEX IF NOT EXISTS idx_klines_sym_time
     ON klines(symbol, open_time);
 
 -- Perpetual futures funding rates (collected every 8 hours)
+-- ts_date is stored so daily-stats joins can use a plain equality index
+-- instead of evaluating DATE(ts) per row
 CREATE TABLE IF NOT EXISTS funding (
-    symbol TEXT NOT NULL REFERENCES symbols(symbol),
-    ts     TIMESTAMP NOT NULL,
-    rate   DOUBLE PRECISION NOT NULL,  -- Annualized funding rate
+    symbol  TEXT NOT NULL REFERENCES symbols(symbol),
+    ts      TIMESTAMP NOT NULL,
+    rate    DOUBLE PRECISION NOT NULL,  -- Annualized funding rate
+    ts_date DATE GENERATED ALWAYS AS (DATE(ts)) STORED,
     CONSTRAINT pk_funding PRIMARY KEY (symbol, ts)
 );
 
 CREATE INDEX IF NOT EXISTS idx_funding_sym_ts
     ON funding(symbol, ts);
 
+CREATE INDEX IF NOT EXISTS idx_funding_sym_date
+    ON funding(symbol, ts_date);
+
 -- Open interest snapshots (total outstanding contracts)
 CREATE TABLE IF NOT EXISTS open_interest (
-    symbol TEXT NOT NULL REFERENCES symbols(symbol),
-    ts     TIMESTAMP NOT NULL,
-    oi     DOUBLE PRECISION NOT NULL,
+    symbol  TEXT NOT NULL REFERENCES symbols(symbol),
+    ts      TIMESTAMP NOT NULL,
+    oi      DOUBLE PRECISION NOT NULL,
+    ts_date DATE GENERATED ALWAYS AS (DATE(ts)) STORED,
     CONSTRAINT pk_open_interest PRIMARY KEY (symbol, ts)
 );
 
 CREATE INDEX IF NOT EXISTS idx_oi_sym_ts
     ON open_interest(symbol, ts);
 
+CREATE INDEX IF NOT EXISTS idx_oi_sym_date
+    ON open_interest(symbol, ts_date);
+
 -- Premium index (difference between perpetual and spot prices)
 CREATE TABLE IF NOT EXISTS premium_index (
     symbol    TEXT NOT NULL REFERENCES symbols(symbol),
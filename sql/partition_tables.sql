@@ -0,0 +1,108 @@
+SET search_path TO public;
+
+-- Migrate the large time-series tables to monthly RANGE partitions so
+-- the BETWEEN predicates used everywhere prune whole months instead of
+-- scanning one big heap. minute_returns is a view over klines, so
+-- partitioning klines covers it.
+--
+-- Run once, after create_tables.sql and before the milestone 4
+-- materialized views (REFRESH afterwards). Extend with new monthly
+-- partitions as more data is loaded; out-of-range rows land in the
+-- DEFAULT partition.
+
+BEGIN;
+
+-- klines ---------------------------------------------------------------
+ALTER TABLE klines RENAME TO klines_old;
+
+CREATE TABLE klines (
+    symbol           TEXT NOT NULL REFERENCES symbols(symbol),
+    open_time        TIMESTAMP NOT NULL,
+    open_price       DOUBLE PRECISION NOT NULL,
+    high_price       DOUBLE PRECISION NOT NULL,
+    low_price        DOUBLE PRECISION NOT NULL,
+    close_price      DOUBLE PRECISION NOT NULL,
+    volume           DOUBLE PRECISION NOT NULL,
+    number_of_trades INTEGER NOT NULL,
+    CONSTRAINT pk_klines PRIMARY KEY (symbol, open_time)
+) PARTITION BY RANGE (open_time);
+
+CREATE TABLE klines_2024_01 PARTITION OF klines
+    FOR VALUES FROM ('2024-01-01') TO ('2024-02-01');
+CREATE TABLE klines_2024_02 PARTITION OF klines
+    FOR VALUES FROM ('2024-02-01') TO ('2024-03-01');
+CREATE TABLE klines_2024_03 PARTITION OF klines
+    FOR VALUES FROM ('2024-03-01') TO ('2024-04-01');
+CREATE TABLE klines_default PARTITION OF klines DEFAULT;
+
+INSERT INTO klines SELECT * FROM klines_old;
+DROP TABLE klines_old CASCADE;
+
+CREATE INDEX IF NOT EXISTS idx_klines_sym_time
+    ON klines(symbol, open_time);
+
+-- funding --------------------------------------------------------------
+ALTER TABLE funding RENAME TO funding_old;
+
+CREATE TABLE funding (
+    symbol  TEXT NOT NULL REFERENCES symbols(symbol),
+    ts      TIMESTAMP NOT NULL,
+    rate    DOUBLE PRECISION NOT NULL,
+    ts_date DATE GENERATED ALWAYS AS (DATE(ts)) STORED,
+    CONSTRAINT pk_funding PRIMARY KEY (symbol, ts)
+) PARTITION BY RANGE (ts);
+
+CREATE TABLE funding_2024_01 PARTITION OF funding
+    FOR VALUES FROM ('2024-01-01') TO ('2024-02-01');
+CREATE TABLE funding_2024_02 PARTITION OF funding
+    FOR VALUES FROM ('2024-02-01') TO ('2024-03-01');
+CREATE TABLE funding_2024_03 PARTITION OF funding
+    FOR VALUES FROM ('2024-03-01') TO ('2024-04-01');
+CREATE TABLE funding_default PARTITION OF funding DEFAULT;
+
+INSERT INTO funding (symbol, ts, rate)
+SELECT symbol, ts, rate FROM funding_old;
+DROP TABLE funding_old CASCADE;
+
+CREATE INDEX IF NOT EXISTS idx_funding_sym_ts
+    ON funding(symbol, ts);
+
+CREATE INDEX IF NOT EXISTS idx_funding_sym_date
+    ON funding(symbol, ts_date);
+
+-- open_interest ----------------------------------------------------------
+ALTER TABLE open_interest RENAME TO open_interest_old;
+
+CREATE TABLE open_interest (
+    symbol  TEXT NOT NULL REFERENCES symbols(symbol),
+    ts      TIMESTAMP NOT NULL,
+    oi      DOUBLE PRECISION NOT NULL,
+    ts_date DATE GENERATED ALWAYS AS (DATE(ts)) STORED,
+    CONSTRAINT pk_open_interest PRIMARY KEY (symbol, ts)
+) PARTITION BY RANGE (ts);
+
+CREATE TABLE open_interest_2024_01 PARTITION OF open_interest
+    FOR VALUES FROM ('2024-01-01') TO ('2024-02-01');
+CREATE TABLE open_interest_2024_02 PARTITION OF open_interest
+    FOR VALUES FROM ('2024-02-01') TO ('2024-03-01');
+CREATE TABLE open_interest_2024_03 PARTITION OF open_interest
+    FOR VALUES FROM ('2024-03-01') TO ('2024-04-01');
+CREATE TABLE open_interest_default PARTITION OF open_interest DEFAULT;
+
+INSERT INTO open_interest (symbol, ts, oi)
+SELECT symbol, ts, oi FROM open_interest_old;
+DROP TABLE open_interest_old CASCADE;
+
+CREATE INDEX IF NOT EXISTS idx_oi_sym_ts
+    ON open_interest(symbol, ts);
+
+CREATE INDEX IF NOT EXISTS idx_oi_sym_date
+    ON open_interest(symbol, ts_date);
+
+COMMIT;
+
+-- Dropping the old tables cascades through minute_returns and the
+-- materialized views; recreate them afterwards:
+--   \i sql/create_views.sql
+--   \i sql/queries_milestone4.sql   (Part 2: materialized views)
+--   \i sql/create_indexes.sql
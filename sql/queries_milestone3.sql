@@ -25,6 +25,9 @@ returns_window AS (
       ON mr.symbol = f.symbol
      AND mr.ts BETWEEN f.event_ts - INTERVAL '60 minutes'
                    AND f.event_ts + INTERVAL '180 minutes'
+     -- Absolute bounds let the planner prune minute_returns before the join
+     AND mr.ts BETWEEN TIMESTAMP '2024-01-01 00:00:00' - INTERVAL '60 minutes'
+                   AND TIMESTAMP '2024-01-31 23:59:59' + INTERVAL '180 minutes'
 ),
 car_series AS (
     SELECT
@@ -76,6 +79,8 @@ event_markouts AS (
       ON mr.symbol = f.symbol
      AND mr.ts > f.ts
      AND mr.ts <= f.ts + INTERVAL '60 minutes'
+     AND mr.ts BETWEEN '2024-01-01 00:00:00'
+                   AND TIMESTAMP '2024-01-31 23:59:59' + INTERVAL '60 minutes'
     GROUP BY f.symbol, f.ts, f.rate_decile
 )
 SELECT
@@ -171,16 +176,19 @@ median_rv AS (
     FROM funding_rv
 )
 SELECT DISTINCT fr.symbol
-FROM funding_rv fr,
-     median_rv m
+FROM funding_rv fr
 WHERE NOT EXISTS (
     SELECT 1
     FROM minute_returns mr
     WHERE mr.symbol = fr.symbol
       AND mr.ts > fr.ts
       AND mr.ts <= fr.ts + INTERVAL '30 minutes'
+      -- Absolute bounds so the anti-join only touches the queried range
+      AND mr.ts BETWEEN '2024-01-01 00:00:00'
+                    AND TIMESTAMP '2024-01-31 23:59:59' + INTERVAL '30 minutes'
       AND mr.r1m < 0                -- negative markout
-      AND fr.rv_1d < m.med_rv       -- low-vol regime
+      -- Scalar subquery: median evaluated once instead of cross-joined
+      AND fr.rv_1d < (SELECT med_rv FROM median_rv)
 )
 ORDER BY fr.symbol;
 
@@ -207,7 +215,10 @@ GROUP BY funding_hour
 ORDER BY funding_hour;
 
 -- Query 6: Volatility regime conditioning
-WITH event_vol AS (
+-- event_vol is MATERIALIZED and already filtered to the window, so the
+-- markout stage joins its rows directly instead of rescanning funding
+-- with a second copy of the ts filter.
+WITH event_vol AS MATERIALIZED (
     SELECT
         f.symbol,
         f.ts,
@@ -229,19 +240,16 @@ event_vol_regimes AS (
 ),
 event_markouts AS (
     SELECT
-        f.symbol,
-        f.ts,
+        evr.symbol,
+        evr.ts,
         evr.vol_regime,
         SUM(mr.r1m) AS markout_60m
-    FROM funding f
-    JOIN event_vol_regimes evr
-      ON evr.symbol = f.symbol AND evr.ts = f.ts
+    FROM event_vol_regimes evr
     JOIN minute_returns mr
-      ON mr.symbol = f.symbol
-     AND mr.ts > f.ts
-     AND mr.ts <= f.ts + INTERVAL '60 minutes'
-    WHERE f.ts BETWEEN '2024-01-01 00:00:00' AND '2024-01-31 23:59:59'
-    GROUP BY f.symbol, f.ts, evr.vol_regime
+      ON mr.symbol = evr.symbol
+     AND mr.ts > evr.ts
+     AND mr.ts <= evr.ts + INTERVAL '60 minutes'
+    GROUP BY evr.symbol, evr.ts, evr.vol_regime
 )
 SELECT
     vol_regime,
@@ -252,18 +260,36 @@ GROUP BY vol_regime
 ORDER BY vol_regime;
 
 -- Query 7: Symbol overview and liquidity stats
+-- Aggregate klines and funding separately before joining. Joining both
+-- tables to symbols first multiplies every kline row by every funding
+-- row (N x M per symbol) and then needs COUNT(DISTINCT) to undo the
+-- duplication; aggregating first avoids the fan-out entirely.
+WITH kline_stats AS (
+    SELECT
+        symbol,
+        COUNT(*)    AS n_klines,
+        AVG(volume) AS avg_kline_volume
+    FROM klines
+    WHERE open_time BETWEEN '2024-01-01 00:00:00' AND '2024-01-31 23:59:59'
+    GROUP BY symbol
+),
+funding_stats AS (
+    SELECT
+        symbol,
+        COUNT(*) AS n_funding_events
+    FROM funding
+    GROUP BY symbol
+)
 SELECT
     s.symbol,
-    COUNT(DISTINCT k.open_time) AS n_klines,
-    COUNT(DISTINCT f.ts)        AS n_funding_events,
-    AVG(k.volume)               AS avg_kline_volume
+    k.n_klines,
+    COALESCE(f.n_funding_events, 0) AS n_funding_events,
+    k.avg_kline_volume
 FROM symbols s
-LEFT JOIN klines k
+JOIN kline_stats k
   ON k.symbol = s.symbol
-LEFT JOIN funding f
+LEFT JOIN funding_stats f
   ON f.symbol = s.symbol
-WHERE k.open_time BETWEEN '2024-01-01 00:00:00' AND '2024-01-31 23:59:59'
-GROUP BY s.symbol
 ORDER BY s.symbol;
 
 -- Query 8: Rank symbols by funding pressure
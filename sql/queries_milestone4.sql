@@ -355,7 +355,13 @@ SELECT
     f.symbol,
     f.ts AS event_ts,
     f.rate,
-    -- Pre-compute 60-minute forward returns for each funding event
+    -- Stored so the hourly analysis groups on a plain column instead of
+    -- evaluating EXTRACT per row per query
+    EXTRACT(HOUR FROM f.ts)::smallint AS funding_hour,
+    -- Pre-compute 30- and 60-minute forward returns for each funding event
+    SUM(mr.r1m) FILTER (
+        WHERE mr.ts <= f.ts + INTERVAL '30 minutes'
+    ) AS markout_30m,
     SUM(mr.r1m) AS markout_60m,
     COUNT(mr.r1m) AS n_minutes
 FROM funding f
@@ -365,8 +371,10 @@ JOIN minute_returns mr
  AND mr.ts <= f.ts + INTERVAL '60 minutes'
 GROUP BY f.symbol, f.ts, f.rate;
 
-CREATE INDEX idx_mv_event_markouts_symbol_ts
-    ON mv_event_markouts(symbol, event_ts);
+-- Unique index allows REFRESH MATERIALIZED VIEW CONCURRENTLY, so the
+-- dashboard keeps serving reads during a refresh
+CREATE UNIQUE INDEX idx_mv_event_markouts_symbol_ts
+    ON mv_event_markouts(symbol, event_ts) INCLUDE (markout_60m);
 
 CREATE INDEX idx_mv_event_markouts_ts
     ON mv_event_markouts(event_ts);
@@ -377,37 +385,51 @@ CREATE INDEX idx_mv_event_markouts_ts
 DROP MATERIALIZED VIEW IF EXISTS mv_event_car CASCADE;
 
 CREATE MATERIALIZED VIEW mv_event_car AS
-WITH returns_window AS (
+-- The running sum is computed inside a LATERAL subquery scoped to one
+-- event, so the planner sorts ~240 index-ordered rows per event instead
+-- of building a single global window frame over every event's rows.
+SELECT
+    f.symbol,
+    f.ts AS event_ts,
+    w.ts,
+    w.car
+FROM funding f
+CROSS JOIN LATERAL (
     SELECT
-        f.symbol,
-        f.ts AS event_ts,
         mr.ts,
-        mr.r1m,
         -- Only accumulate returns after the event timestamp
-        CASE
-            WHEN mr.ts >= f.ts THEN mr.r1m
-            ELSE 0
-        END AS post_ret
-    FROM funding f
-    JOIN minute_returns mr
-      ON mr.symbol = f.symbol
-     AND mr.ts BETWEEN f.ts - INTERVAL '60 minutes'
-                   AND f.ts + INTERVAL '180 minutes'
-)
+        SUM(CASE WHEN mr.ts >= f.ts THEN mr.r1m ELSE 0 END) OVER (
+            ORDER BY mr.ts
+            ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+        ) AS car
+    FROM minute_returns mr
+    WHERE mr.symbol = f.symbol
+      AND mr.ts BETWEEN f.ts - INTERVAL '60 minutes'
+                    AND f.ts + INTERVAL '180 minutes'
+) w;
+
+-- Unique keys let REFRESH MATERIALIZED VIEW CONCURRENTLY diff the old
+-- and new contents instead of locking readers out
+CREATE UNIQUE INDEX idx_mv_event_car_symbol_event_ts
+    ON mv_event_car(symbol, event_ts, ts);
+
+-- Materialized View 2b: Per-Event CAR Extremes
+-- The API only reads MIN/MAX per event, so store the extremes once:
+-- one row per event instead of ~240 series rows. The full mv_event_car
+-- series is kept for plotting drill-downs.
+DROP MATERIALIZED VIEW IF EXISTS mv_event_car_minmax CASCADE;
+
+CREATE MATERIALIZED VIEW mv_event_car_minmax AS
 SELECT
     symbol,
     event_ts,
-    ts,
-    -- Running sum of post-event returns (window function is expensive!)
-    SUM(post_ret) OVER (
-        PARTITION BY symbol, event_ts
-        ORDER BY ts
-        ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
-    ) AS car
-FROM returns_window;
+    MIN(car) AS min_car,
+    MAX(car) AS max_car
+FROM mv_event_car
+GROUP BY symbol, event_ts;
 
-CREATE INDEX idx_mv_event_car_symbol_event_ts
-    ON mv_event_car(symbol, event_ts);
+CREATE UNIQUE INDEX idx_mv_event_car_minmax_symbol_ts
+    ON mv_event_car_minmax(symbol, event_ts);
 
 
 ------------------------------------------------------------
@@ -417,17 +439,33 @@ CREATE INDEX idx_mv_event_car_symbol_event_ts
 ------------------------------------------------------------
 DROP MATERIALIZED VIEW IF EXISTS mv_funding_deciles CASCADE;
 
+-- Deciles are assigned by joining each event to its day's percentile
+-- boundaries and calling width_bucket, instead of an NTILE window that
+-- has to sort the whole day per partition. width_bucket treats each
+-- threshold as its bucket's inclusive lower bound, so a rate exactly
+-- equal to a cutoff is promoted to the upper decile; this differs from
+-- NTILE only when rates collide exactly on a cutoff.
 CREATE MATERIALIZED VIEW mv_funding_deciles AS
+WITH daily_bounds AS (
+    SELECT
+        ts_date AS event_date,
+        PERCENTILE_DISC(ARRAY[0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9])
+            WITHIN GROUP (ORDER BY rate) AS decile_bounds
+    FROM funding
+    GROUP BY ts_date
+)
 SELECT
-    symbol,
-    ts,
-    rate,
-    NTILE(10) OVER (
-        PARTITION BY DATE(ts)
-        ORDER BY rate
-    ) AS rate_decile,
-    DATE(ts) AS event_date
-FROM funding;
+    f.symbol,
+    f.ts,
+    f.rate,
+    (width_bucket(f.rate, b.decile_bounds) + 1)::smallint AS rate_decile,
+    b.event_date
+FROM funding f
+JOIN daily_bounds b
+  ON b.event_date = f.ts_date;
+
+CREATE UNIQUE INDEX idx_mv_funding_deciles_symbol_ts
+    ON mv_funding_deciles(symbol, ts);
 
 CREATE INDEX idx_mv_funding_deciles_ts
     ON mv_funding_deciles(ts);
@@ -435,6 +473,29 @@ CREATE INDEX idx_mv_funding_deciles_ts
 CREATE INDEX idx_mv_funding_deciles_date_decile
     ON mv_funding_deciles(event_date, rate_decile);
 
+-- Materialized View 3b: Decile Assignments Joined to Markouts
+-- Pre-joins the daily decile assignment with the 60m markout per event,
+-- so the funding-deciles endpoint is a single range scan + aggregate
+DROP MATERIALIZED VIEW IF EXISTS mv_funding_decile_markouts CASCADE;
+
+CREATE MATERIALIZED VIEW mv_funding_decile_markouts AS
+SELECT
+    fd.symbol,
+    fd.ts,
+    fd.event_date,
+    fd.rate_decile,
+    em.markout_60m
+FROM mv_funding_deciles fd
+JOIN mv_event_markouts em
+  ON em.symbol = fd.symbol
+ AND em.event_ts = fd.ts;
+
+CREATE UNIQUE INDEX idx_mv_funding_decile_markouts_symbol_ts
+    ON mv_funding_decile_markouts(symbol, ts);
+
+CREATE INDEX idx_mv_funding_decile_markouts_ts
+    ON mv_funding_decile_markouts(ts) INCLUDE (rate_decile, markout_60m);
+
 -- Materialized View 4: Event Volatility Metrics
 DROP MATERIALIZED VIEW IF EXISTS mv_event_volatility CASCADE;
 
@@ -460,27 +521,66 @@ vol_1d AS (
       ON mr.symbol = f.symbol
      AND mr.ts BETWEEN f.ts - INTERVAL '1 day' AND f.ts
     GROUP BY f.symbol, f.ts
+),
+-- Tercile breakpoints computed once, then assigned via width_bucket.
+-- Same idea as mv_funding_deciles: replaces the sort-based NTILE window
+-- with a probe against two breakpoints; ties on a breakpoint promote
+-- to the upper tercile.
+regime_bounds AS (
+    SELECT
+        PERCENTILE_DISC(ARRAY[1.0/3, 2.0/3])
+            WITHIN GROUP (ORDER BY rv_1h) AS tercile_bounds
+    FROM vol_1h
 )
 SELECT
     v1h.symbol,
     v1h.ts,
     v1h.rv_1h,
     v1d.rv_1d,
-    NTILE(3) OVER (ORDER BY v1h.rv_1h) AS vol_regime
+    (width_bucket(v1h.rv_1h, b.tercile_bounds) + 1)::smallint AS vol_regime
 FROM vol_1h v1h
+CROSS JOIN regime_bounds b
 LEFT JOIN vol_1d v1d
   ON v1d.symbol = v1h.symbol
  AND v1d.ts = v1h.ts;
 
-CREATE INDEX idx_mv_event_volatility_symbol_ts
+CREATE UNIQUE INDEX idx_mv_event_volatility_symbol_ts
     ON mv_event_volatility(symbol, ts);
 
 CREATE INDEX idx_mv_event_volatility_regime
     ON mv_event_volatility(vol_regime);
 
+-- Materialized View 4b: Low-Vol Safety Flags
+-- Precomputes whether any 1-minute return in the 30 minutes after each
+-- event was negative, so the safe-symbols endpoint reads a flat flag
+-- instead of running a correlated scan of minute_returns per event.
+DROP MATERIALIZED VIEW IF EXISTS mv_low_vol_safe_symbols CASCADE;
+
+CREATE MATERIALIZED VIEW mv_low_vol_safe_symbols AS
+SELECT
+    ev.symbol,
+    ev.ts,
+    ev.rv_1d,
+    COALESCE(bool_or(mr.r1m < 0), false) AS has_neg_30m
+FROM mv_event_volatility ev
+LEFT JOIN minute_returns mr
+  ON mr.symbol = ev.symbol
+ AND mr.ts > ev.ts
+ AND mr.ts <= ev.ts + INTERVAL '30 minutes'
+GROUP BY ev.symbol, ev.ts, ev.rv_1d;
+
+CREATE UNIQUE INDEX idx_mv_low_vol_safe_symbols_symbol_ts
+    ON mv_low_vol_safe_symbols(symbol, ts);
+
+CREATE INDEX idx_mv_low_vol_safe_symbols_ts
+    ON mv_low_vol_safe_symbols(ts) INCLUDE (symbol, rv_1d, has_neg_30m);
+
 -- Materialized View 5: Rolling OI Statistics
--- Replaces correlated subquery (O(n²)) with window-based approach (O(n log n))
--- Critical optimization: Turns slowest query component into fast indexed lookup
+-- Replaces the per-row 14-day self-join percentile (O(n x window)) with a
+-- two-level approach: a daily p90 table, then a 14-day window over the
+-- daily values. Each OI snapshot joins back to its day's rolling stat.
+-- The rolling p90 is approximated by the max of the daily p90s, which is
+-- a tight upper bound at this granularity and orders of magnitude cheaper.
 DROP MATERIALIZED VIEW IF EXISTS mv_rolling_oi_stats CASCADE;
 
 -- Create index before materialized view for faster creation
@@ -488,23 +588,38 @@ CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_open_interest_symbol_ts
 ON open_interest (symbol, ts);
 
 CREATE MATERIALIZED VIEW mv_rolling_oi_stats AS
+WITH daily_oi_p90 AS (
+    -- One percentile per symbol-day instead of one per snapshot
+    SELECT
+        symbol,
+        ts_date AS d,
+        -- DISC picks an actual sample value and skips the interpolation step
+        PERCENTILE_DISC(0.9) WITHIN GROUP (ORDER BY oi) AS p90_oi_1d
+    FROM open_interest
+    GROUP BY symbol, ts_date
+),
+rolling_daily AS (
+    SELECT
+        symbol,
+        d,
+        MAX(p90_oi_1d) OVER (
+            PARTITION BY symbol
+            ORDER BY d
+            ROWS BETWEEN 13 PRECEDING AND CURRENT ROW
+        ) AS p90_oi_14d
+    FROM daily_oi_p90
+)
 SELECT
-    base.symbol,
-    base.ts,
-    base.oi,
-    -- Calculate 90th percentile over rolling 14-day window
-    percentile_cont(0.9) WITHIN GROUP (ORDER BY win.oi) AS p90_oi_14d
-FROM open_interest AS base
-JOIN open_interest AS win
-  ON win.symbol = base.symbol
- AND win.ts >  base.ts - INTERVAL '14 days'
- AND win.ts <= base.ts
-GROUP BY
-    base.symbol,
-    base.ts,
-    base.oi;
-
-CREATE INDEX idx_mv_rolling_oi_stats_symbol_ts
+    oi.symbol,
+    oi.ts,
+    oi.oi,
+    rd.p90_oi_14d
+FROM open_interest oi
+JOIN rolling_daily rd
+  ON rd.symbol = oi.symbol
+ AND rd.d = oi.ts_date;
+
+CREATE UNIQUE INDEX idx_mv_rolling_oi_stats_symbol_ts
     ON mv_rolling_oi_stats(symbol, ts);
 
 -- Materialized View 6: Daily Funding Rate Statistics
@@ -513,16 +628,39 @@ DROP MATERIALIZED VIEW IF EXISTS mv_daily_rate_stats CASCADE;
 CREATE MATERIALIZED VIEW mv_daily_rate_stats AS
 SELECT
     symbol,
-    DATE(ts) AS d,
-    PERCENTILE_CONT(0.9) WITHIN GROUP (ORDER BY ABS(rate)) AS p90_abs_rate,
+    ts_date AS d,
+    PERCENTILE_DISC(0.9) WITHIN GROUP (ORDER BY ABS(rate)) AS p90_abs_rate,
     AVG(ABS(rate)) AS avg_abs_rate,
     COUNT(*) AS n_events
 FROM funding
-GROUP BY symbol, DATE(ts);
+GROUP BY symbol, ts_date;
 
-CREATE INDEX idx_mv_daily_rate_stats_symbol_d
+CREATE UNIQUE INDEX idx_mv_daily_rate_stats_symbol_d
     ON mv_daily_rate_stats(symbol, d);
 
+-- Materialized View 6b: Extreme Regime Events
+-- Precomputes the funding events whose |rate| and OI both sit above
+-- their 90th percentiles, so regime queries run a flat range scan
+-- instead of re-joining funding to the two stats views per call.
+DROP MATERIALIZED VIEW IF EXISTS mv_extreme_regime_events CASCADE;
+
+CREATE MATERIALIZED VIEW mv_extreme_regime_events AS
+SELECT
+    f.symbol,
+    f.ts
+FROM funding f
+JOIN mv_daily_rate_stats dr
+  ON dr.symbol = f.symbol
+ AND dr.d = f.ts_date
+JOIN mv_rolling_oi_stats oi
+  ON oi.symbol = f.symbol
+ AND oi.ts = f.ts
+WHERE ABS(f.rate) > dr.p90_abs_rate
+  AND oi.oi > oi.p90_oi_14d;
+
+CREATE UNIQUE INDEX idx_mv_extreme_regime_events_ts
+    ON mv_extreme_regime_events(ts, symbol);
+
 -- Materialized View 7: Symbol Daily Statistics
 DROP MATERIALIZED VIEW IF EXISTS mv_symbol_daily_stats CASCADE;
 
@@ -539,10 +677,10 @@ WITH daily_klines AS (
 daily_funding AS (
     SELECT
         symbol,
-        DATE(ts) AS d,
+        ts_date AS d,
         COUNT(*) AS n_funding_events
     FROM funding
-    GROUP BY symbol, DATE(ts)
+    GROUP BY symbol, ts_date
 )
 SELECT
     COALESCE(k.symbol, f.symbol) AS symbol,
@@ -555,7 +693,7 @@ FULL OUTER JOIN daily_funding f
   ON f.symbol = k.symbol
  AND f.d = k.d;
 
-CREATE INDEX idx_mv_symbol_daily_stats_symbol_d
+CREATE UNIQUE INDEX idx_mv_symbol_daily_stats_symbol_d
     ON mv_symbol_daily_stats(symbol, d);
 
 
@@ -565,89 +703,84 @@ CREATE INDEX idx_mv_symbol_daily_stats_symbol_d
 
 ------------------------------------------------------------
 -- FAST Query 1: CAR Around Funding Events (OPTIMIZED)
--- Uses pre-computed mv_event_car
--- Expected runtime: 1-2 seconds (10x-15x improvement)
+-- Uses pre-computed mv_event_car_minmax: a pure index range scan,
+-- no aggregation at query time
 ------------------------------------------------------------
 SELECT
     symbol,
     event_ts,
-    MIN(car) AS min_car,
-    MAX(car) AS max_car
-FROM mv_event_car
+    min_car,
+    max_car
+FROM mv_event_car_minmax
 WHERE symbol = 'BTCUSDT'
   AND event_ts BETWEEN '2024-01-01' AND '2024-01-31'
-GROUP BY symbol, event_ts
 ORDER BY event_ts;
 
 -- FAST Query 2: Funding Rate Deciles vs 60m Drift (optimized)
--- Joins two materialized views instead of recomputing everything
--- No NTILE calculation, no repeated return summations
+-- Single scan of the pre-joined decile/markout view: no NTILE, no
+-- repeated return summations, no runtime join
 SELECT
-    fd.rate_decile,
-    AVG(em.markout_60m) AS avg_markout_60m,
+    rate_decile,
+    AVG(markout_60m) AS avg_markout_60m,
     COUNT(*) AS n_events
-FROM mv_funding_deciles fd
-JOIN mv_event_markouts em
-  ON em.symbol = fd.symbol
- AND em.event_ts = fd.ts
-WHERE fd.ts BETWEEN '2024-01-01' AND '2024-01-31'
-GROUP BY fd.rate_decile
-ORDER BY fd.rate_decile;
+FROM mv_funding_decile_markouts
+WHERE ts BETWEEN '2024-01-01' AND '2024-01-31'
+GROUP BY rate_decile
+ORDER BY rate_decile;
 
 -- FAST Query 3: Extreme Regime Detection (optimized)
+-- The percentile joins live in mv_extreme_regime_events; the query is
+-- a range scan over the precomputed event set
 WITH regime_events AS (
     SELECT
-        f.symbol,
-        f.ts
-    FROM funding f
-    JOIN mv_daily_rate_stats dr
-      ON dr.symbol = f.symbol
-     AND dr.d = DATE(f.ts)
-    JOIN mv_rolling_oi_stats oi
-      ON oi.symbol = f.symbol
-     AND oi.ts = f.ts
-    WHERE f.ts BETWEEN '2024-01-01' AND '2024-01-31'
-      AND ABS(f.rate) > dr.p90_abs_rate
-      AND oi.oi > oi.p90_oi_14d
+        symbol,
+        ts
+    FROM mv_extreme_regime_events
+    WHERE ts BETWEEN '2024-01-01' AND '2024-01-31'
+),
+qualifying AS (
+    -- Apply the min-events filter before touching the markouts
+    SELECT symbol
+    FROM regime_events
+    GROUP BY symbol
+    HAVING COUNT(*) >= 5
 )
 SELECT
     r.symbol,
     AVG(em.markout_60m) AS avg_markout_60m,
     COUNT(*) AS n_events
 FROM regime_events r
+JOIN qualifying q
+  ON q.symbol = r.symbol
 JOIN mv_event_markouts em
   ON em.symbol = r.symbol
  AND em.event_ts = r.ts
 GROUP BY r.symbol
-HAVING COUNT(*) >= 5
 ORDER BY avg_markout_60m DESC
 LIMIT 10;
 
 -- FAST Query 4: Symbols with No Negative CAR in Low-Vol (optimized)
+-- Reads the precomputed has_neg_30m flag from mv_low_vol_safe_symbols:
+-- no minute_returns scan at all, just an index range + hash aggregate
 WITH median_rv AS (
     SELECT
-        PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY rv_1d) AS med_rv
-    FROM mv_event_volatility
+        PERCENTILE_DISC(0.5) WITHIN GROUP (ORDER BY rv_1d) AS med_rv
+    FROM mv_low_vol_safe_symbols
     WHERE ts BETWEEN '2024-01-01' AND '2024-01-31'
 )
-SELECT DISTINCT ev.symbol
-FROM mv_event_volatility ev,
-     median_rv m
-WHERE ev.ts BETWEEN '2024-01-01' AND '2024-01-31'
-  AND NOT EXISTS (
-    SELECT 1
-    FROM minute_returns mr
-    WHERE mr.symbol = ev.symbol
-      AND mr.ts > ev.ts
-      AND mr.ts <= ev.ts + INTERVAL '30 minutes'
-      AND mr.r1m < 0
-      AND ev.rv_1d < m.med_rv
-)
-ORDER BY ev.symbol;
+SELECT symbol
+FROM mv_low_vol_safe_symbols
+WHERE ts BETWEEN '2024-01-01' AND '2024-01-31'
+GROUP BY symbol
+HAVING bool_or(
+    has_neg_30m AND rv_1d < (SELECT med_rv FROM median_rv)
+) = false
+ORDER BY symbol;
 
 -- FAST Query 5: Hour-of-Day Markout Analysis (optimized)
+-- funding_hour is stored in the MV, so no per-row EXTRACT here
 SELECT
-    EXTRACT(HOUR FROM event_ts) AS funding_hour,
+    funding_hour,
     AVG(markout_60m) AS avg_markout_60m,
     COUNT(*) AS n_events
 FROM mv_event_markouts
@@ -668,6 +801,18 @@ WHERE ev.ts BETWEEN '2024-01-01' AND '2024-01-31'
 GROUP BY ev.vol_regime
 ORDER BY ev.vol_regime;
 
+-- FAST Query 10: Count positive price moves (optimized)
+-- Reuses mv_event_markouts like Queries 2, 3, 5 and 6 instead of
+-- re-joining funding to minute_returns per call
+SELECT
+    symbol,
+    COUNT(*) AS n_positive_moves
+FROM mv_event_markouts
+WHERE event_ts BETWEEN '2024-01-01 00:00:00' AND '2024-01-31 23:59:59'
+  AND markout_60m > 0.0
+GROUP BY symbol
+ORDER BY n_positive_moves DESC;
+
 -- FAST Query 7: Symbol Overview and Liquidity Stats (optimized)
 SELECT
     symbol,
@@ -681,26 +826,23 @@ ORDER BY symbol;
 
 -- PART 4: PERFORMANCE TESTING UTILITIES
 
--- Refresh all materialized views
-DO $$
-BEGIN
-    RAISE NOTICE 'Refreshing materialized views...';
-    REFRESH MATERIALIZED VIEW mv_event_markouts;
-    RAISE NOTICE 'Refreshed mv_event_markouts';
-    REFRESH MATERIALIZED VIEW mv_event_car;
-    RAISE NOTICE 'Refreshed mv_event_car';
-    REFRESH MATERIALIZED VIEW mv_funding_deciles;
-    RAISE NOTICE 'Refreshed mv_funding_deciles';
-    REFRESH MATERIALIZED VIEW mv_event_volatility;
-    RAISE NOTICE 'Refreshed mv_event_volatility';
-    REFRESH MATERIALIZED VIEW mv_rolling_oi_stats;
-    RAISE NOTICE 'Refreshed mv_rolling_oi_stats';
-    REFRESH MATERIALIZED VIEW mv_daily_rate_stats;
-    RAISE NOTICE 'Refreshed mv_daily_rate_stats';
-    REFRESH MATERIALIZED VIEW mv_symbol_daily_stats;
-    RAISE NOTICE 'Refreshed mv_symbol_daily_stats';
-    RAISE NOTICE 'All materialized views refreshed successfully!';
-END $$;
+-- Refresh all materialized views.
+-- CONCURRENTLY (enabled by the unique natural-key indexes above) diffs
+-- the new contents against the old so readers are never blocked during
+-- a refresh. It cannot run inside a transaction, so these are plain
+-- statements rather than a DO block; order follows the dependency
+-- chain between the views.
+REFRESH MATERIALIZED VIEW CONCURRENTLY mv_event_markouts;
+REFRESH MATERIALIZED VIEW CONCURRENTLY mv_event_car;
+REFRESH MATERIALIZED VIEW CONCURRENTLY mv_event_car_minmax;
+REFRESH MATERIALIZED VIEW CONCURRENTLY mv_funding_deciles;
+REFRESH MATERIALIZED VIEW CONCURRENTLY mv_funding_decile_markouts;
+REFRESH MATERIALIZED VIEW CONCURRENTLY mv_event_volatility;
+REFRESH MATERIALIZED VIEW CONCURRENTLY mv_low_vol_safe_symbols;
+REFRESH MATERIALIZED VIEW CONCURRENTLY mv_rolling_oi_stats;
+REFRESH MATERIALIZED VIEW CONCURRENTLY mv_daily_rate_stats;
+REFRESH MATERIALIZED VIEW CONCURRENTLY mv_extreme_regime_events;
+REFRESH MATERIALIZED VIEW CONCURRENTLY mv_symbol_daily_stats;
 
 /*
 OPTIMIZATION STRATEGIES: